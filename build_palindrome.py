@@ -0,0 +1,30 @@
+"""
+Ahead-of-time build script for the palindrome checker.
+
+Running this script (with Numba installed) compiles the integer
+half-reversal palindrome test into a native extension module
+`_palindrome`, which deepak.py picks up at import time. This gives
+native-code speed without the first-call JIT warmup of @njit.
+
+Usage:
+    python build_palindrome.py
+"""
+
+from numba.pycc import CC
+
+cc = CC('_palindrome')
+
+@cc.export('is_pal', 'b1(i8)')
+def is_pal(n):
+    if n < 0:
+        return False
+    if n % 10 == 0 and n != 0:
+        return False
+    half = 0
+    while n > half:
+        half = half * 10 + n % 10
+        n //= 10
+    return n == half or n == half // 10
+
+if __name__ == '__main__':
+    cc.compile()
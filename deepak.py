@@ -1,31 +1,87 @@
+import re
 from typing import Union
 
+try:
+    from numba import boolean, int64, njit, prange
+except ImportError:  # Numba is optional; fall back to pure Python
+    njit = None
+    prange = range
+
+# Validate input up front instead of paying for a raised ValueError;
+# matches what int() accepts: either sign and underscore-grouped digits
+_INT_RE = re.compile(r"\s*[+-]?\d+(?:_\d+)*\s*")
+
 def get_user_input() -> int:
     """
     Get a valid integer from user input.
-    
+
     Returns:
         int: The number entered by the user
     """
     while True:
-        try:
-            return int(input("Enter a number: "))
-        except ValueError:
-            print("Please enter a valid integer.")
+        s = input("Enter a number: ")
+        if _INT_RE.fullmatch(s):
+            return int(s)
+        print("Please enter a valid integer.")
 
 def check_number(number: int) -> bool:
     """
     Check if a number is a palindrome.
-    
+
     Args:
         number (int): The number to check
-        
+
     Returns:
         bool: True if the number is a palindrome, False otherwise
     """
-    # Convert number to string for easy comparison
-    num_str = str(number)
-    return num_str == num_str[::-1]
+    # Reverse only the second half of the digits and compare against the
+    # first half - non-palindromes bail out after a couple of iterations
+    # instead of paying for a full reversal
+    if number < 0:
+        return False
+    if number % 10 == 0 and number != 0:
+        # A positive multiple of 10 can never be a palindrome
+        return False
+    half = 0
+    while number > half:
+        half = half * 10 + number % 10
+        number //= 10
+    # half // 10 drops the middle digit for odd digit counts
+    return number == half or number == half // 10
+
+try:
+    # Prefer the ahead-of-time compiled extension (see
+    # build_palindrome.py) - native speed with zero JIT warmup
+    from _palindrome import is_pal as check_number
+except ImportError:
+    if njit is not None:
+        # Compile eagerly with an explicit signature so no call pays the
+        # type-inference cost; cache=True persists the compiled artifact.
+        check_number = njit(boolean(int64), cache=True, nogil=True)(check_number)
+
+def check_numbers(arr, out) -> None:
+    """
+    Check every number in an int64 array for palindromes in parallel.
+
+    Args:
+        arr: One-dimensional int64 array of numbers to check
+        out: Boolean array of the same shape; out[i] is set to True
+             when arr[i] is a palindrome
+    """
+    for i in prange(arr.shape[0]):
+        n = arr[i]
+        if n < 0:
+            out[i] = False
+            continue
+        orig, rev = n, 0
+        while n:
+            rev = rev * 10 + n % 10
+            n //= 10
+        out[i] = rev == orig
+
+if njit is not None:
+    check_numbers = njit(parallel=True, cache=True, nogil=True,
+                         boundscheck=False)(check_numbers)
 
 def is_palindrome() -> None:
     """
@@ -34,9 +90,19 @@ def is_palindrome() -> None:
     try:
         # Get input from user
         number = get_user_input()
-        
-        # Check if number is palindrome
-        result = check_number(number)
+
+        # Check if number is palindrome, short-circuiting the trivial
+        # values so most inputs never reach the digit loop
+        if number < 0:
+            result = False
+        elif number < 10:
+            # Single digits are always palindromes
+            result = True
+        elif number % 10 == 0:
+            # A positive multiple of 10 can never be a palindrome
+            result = False
+        else:
+            result = check_number(number)
         
         # Display result
         print(f"The number {number} is {'' if result else 'not '}a palindrome")
@@ -1,18 +1,23 @@
+import functools
+import sys
+from pathlib import Path
+
 from nlp_compiler import NLCompiler
 
 compiler = NLCompiler()
 
+# Repeated identical prompts hit the cache instead of re-running the
+# full NLP pipeline
+cached_compile = functools.lru_cache(maxsize=256)(compiler.compile)
+
 # Put your prompt (instruction) here:
 instruction = "Write a Python code to check if a number is palindrome"
 
 # Compile the instruction to generate code
-code = compiler.compile(instruction)
-
-# Print the generated code
-print("Generated Code:")
-print(code)
+code = cached_compile(instruction)
 
-with open("generated_code.py", "w") as f:
-    f.write(code)
-print("Generated code saved to generated_code.py")
+# Print the generated code in one write and save it in a single call
+sys.stdout.write(f"Generated Code:\n{code}\n")
+Path("generated_code.py").write_text(code)
+sys.stdout.write("Generated code saved to generated_code.py\n")
 #generarted on 25/05/2025
\ No newline at end of file
@@ -2,7 +2,14 @@
 NLP Compiler - A rule-based natural language to Python code compiler.
 """
 
-from .compiler import NLCompiler
-
 __version__ = "0.1.0"
-__all__ = ["NLCompiler"] 
\ No newline at end of file
+__all__ = ["NLCompiler"]
+
+def __getattr__(name):
+    # Import the compiler toolchain lazily (PEP 562) so that importing
+    # the package for metadata doesn't pay the full pipeline import cost
+    if name == "NLCompiler":
+        from .compiler import NLCompiler
+        globals()["NLCompiler"] = NLCompiler
+        return NLCompiler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,26 +3,63 @@ Main compiler class that orchestrates the NLP to Python code compilation pipelin
 """
 
 from typing import Dict, Any, Optional
-import spacy
+from collections import OrderedDict
+from functools import cached_property
 from .lexer.tokenizer import Tokenizer
 from .parser.parser import Parser
 from .semantic.analyzer import SemanticAnalyzer
 from .codegen.generator import CodeGenerator
 
+# Shared spaCy pipeline, loaded on first use. Model loading costs
+# hundreds of milliseconds, so it is deferred until a compile actually
+# needs it and shared across NLCompiler instances.
+_NLP = None
+
+def _load_nlp():
+    """Load (once) and return the shared spaCy pipeline."""
+    global _NLP
+    if _NLP is None:
+        import spacy
+        # NER output is never consumed, and the dependency parse
+        # (dep_) is stored on tokens but not read by any later stage,
+        # so both components are excluded to cut per-call inference
+        # cost and model memory. The attribute_ruler and lemmatizer
+        # stay: the parser relies on coarse POS tags and lemmas.
+        _NLP = spacy.load("en_core_web_sm", exclude=["ner", "parser"])
+    return _NLP
+
 class NLCompiler:
     """Main compiler class that coordinates the compilation pipeline."""
-    
+
+    # Upper bound on cached compilations; old entries are evicted LRU
+    _CACHE_SIZE = 512
+
     def __init__(self):
         """Initialize the compiler with required components."""
-        # Load spaCy model for NLP processing
-        self.nlp = spacy.load("en_core_web_sm")
-        
-        # Initialize compiler components
-        self.tokenizer = Tokenizer(self.nlp)
+        # Initialize compiler components; the spaCy model (and the
+        # tokenizer wrapping it) load lazily on first use
         self.parser = Parser()
         self.semantic_analyzer = SemanticAnalyzer()
         self.code_generator = CodeGenerator()
-    
+
+        # LRU cache of generated code keyed on the normalized
+        # instruction (tokenization lowercases anyway, so case and
+        # surrounding whitespace cannot change the output). When an
+        # analysis context is set it joins the key, since context can
+        # change the generated code; unhashable contexts bypass the
+        # cache.
+        self._compile_cache: "OrderedDict[Any, str]" = OrderedDict()
+
+    @cached_property
+    def nlp(self):
+        """The shared spaCy pipeline, loaded on first access."""
+        return _load_nlp()
+
+    @cached_property
+    def tokenizer(self) -> Tokenizer:
+        """Tokenizer bound to the shared pipeline, built on first use."""
+        return Tokenizer(self.nlp)
+
     def compile(self, instruction: str) -> str:
         """
         Compile natural language instruction to Python code.
@@ -36,22 +73,41 @@ class NLCompiler:
         Raises:
             CompilationError: If compilation fails at any stage
         """
+        key: Any = instruction.strip().lower()
+        context = self.semantic_analyzer.context
+        if context:
+            try:
+                key = (key, frozenset(context.items()))
+            except TypeError:
+                # Unhashable context values: bypass the cache
+                key = None
+        if key is not None:
+            cached = self._compile_cache.get(key)
+            if cached is not None:
+                self._compile_cache.move_to_end(key)
+                return cached
+
         # 1. Lexical Analysis
         tokens = self.tokenizer.tokenize(instruction)
-        
+
         # 2. Parsing
         parse_tree = self.parser.parse(tokens)
-        
+
         # 3. Semantic Analysis
         # Pass the first child node (actual instruction) if available
         if parse_tree.children:
             semantic_info = self.semantic_analyzer.analyze(parse_tree.children[0])
         else:
             semantic_info = self.semantic_analyzer.analyze(parse_tree)
-        
+
         # 4. Code Generation
         generated_code = self.code_generator.generate(semantic_info)
-        
+
+        if key is not None:
+            self._compile_cache[key] = generated_code
+            if len(self._compile_cache) > self._CACHE_SIZE:
+                self._compile_cache.popitem(last=False)
+
         return generated_code
     
     def compile_with_context(self, instruction: str, context: Optional[Dict[str, Any]] = None) -> str:
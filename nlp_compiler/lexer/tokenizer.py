@@ -2,14 +2,80 @@
 Lexical analysis component that tokenizes input text using spaCy.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property
+import re
 from spacy.tokens import Doc
 from spacy.language import Language
 
-@dataclass
-class Token:
-    """Represents a token with its properties."""
+# Coarse POS tags for the vocabulary the downstream parser actually
+# inspects. When an instruction stays inside this table the full spaCy
+# pipeline can be skipped entirely; anything off-vocabulary falls back
+# to the model.
+_POS_TABLE: Dict[str, str] = {
+    # Instruction verbs
+    'write': 'VERB', 'create': 'VERB', 'build': 'VERB', 'define': 'VERB',
+    'make': 'VERB', 'add': 'VERB', 'subtract': 'VERB', 'multiply': 'VERB',
+    'divide': 'VERB', 'check': 'VERB', 'checking': 'VERB', 'get': 'VERB',
+    'set': 'VERB', 'remove': 'VERB', 'find': 'VERB', 'calculate': 'VERB',
+    'compute': 'VERB', 'display': 'VERB', 'show': 'VERB', 'print': 'VERB',
+    'return': 'VERB', 'returns': 'VERB', 'generate': 'VERB', 'count': 'VERB',
+    'reverse': 'VERB', 'sort': 'VERB', 'search': 'VERB', 'implement': 'VERB',
+    'convert': 'VERB', 'replace': 'VERB', 'toggle': 'VERB', 'swap': 'VERB',
+    # Domain nouns
+    'python': 'PROPN', 'code': 'NOUN', 'function': 'NOUN', 'class': 'NOUN',
+    'method': 'NOUN', 'methods': 'NOUN', 'number': 'NOUN', 'numbers': 'NOUN',
+    'string': 'NOUN', 'strings': 'NOUN', 'list': 'NOUN', 'array': 'NOUN',
+    'palindrome': 'NOUN', 'prime': 'NOUN', 'factorial': 'NOUN',
+    'fibonacci': 'PROPN', 'armstrong': 'PROPN', 'gcd': 'NOUN', 'lcm': 'NOUN',
+    'sum': 'NOUN', 'average': 'NOUN', 'median': 'NOUN', 'square': 'NOUN',
+    'root': 'NOUN', 'employee': 'NOUN', 'name': 'NOUN', 'salary': 'NOUN',
+    'details': 'NOUN', 'attribute': 'NOUN', 'attributes': 'NOUN',
+    'element': 'NOUN', 'elements': 'NOUN', 'character': 'NOUN',
+    'characters': 'NOUN', 'word': 'NOUN', 'words': 'NOUN', 'vowel': 'NOUN',
+    'vowels': 'NOUN', 'consonant': 'NOUN', 'consonants': 'NOUN',
+    'anagram': 'NOUN', 'anagrams': 'NOUN', 'frequency': 'NOUN',
+    'duplicate': 'NOUN', 'duplicates': 'NOUN', 'digit': 'NOUN',
+    'digits': 'NOUN', 'tree': 'NOUN', 'graph': 'NOUN', 'stack': 'NOUN',
+    'queue': 'NOUN', 'sentence': 'NOUN', 'expression': 'NOUN',
+    'operation': 'NOUN', 'operations': 'NOUN', 'value': 'NOUN',
+    'values': 'NOUN',
+    # Function words
+    'a': 'DET', 'an': 'DET', 'the': 'DET', 'some': 'DET', 'any': 'DET',
+    'to': 'PART', 'for': 'ADP', 'of': 'ADP', 'in': 'ADP', 'with': 'ADP',
+    'from': 'ADP', 'on': 'ADP', 'into': 'ADP', 'by': 'ADP',
+    'if': 'SCONJ', 'that': 'SCONJ', 'whether': 'SCONJ', 'and': 'CCONJ',
+    'or': 'CCONJ', 'not': 'PART', 'is': 'AUX', 'are': 'AUX',
+    'two': 'NUM', 'three': 'NUM', 'given': 'VERB', 'using': 'VERB',
+    'all': 'DET', 'each': 'DET', 'its': 'PRON', 'it': 'PRON',
+}
+
+# Lemmas for the handful of inflected forms the parser keys on; every
+# other word lemmatizes to itself.
+_LEMMA_TABLE: Dict[str, str] = {
+    'checking': 'check', 'returns': 'return', 'numbers': 'number',
+    'strings': 'string', 'methods': 'method', 'elements': 'element',
+    'characters': 'character', 'words': 'word', 'vowels': 'vowel',
+    'consonants': 'consonant', 'anagrams': 'anagram',
+    'duplicates': 'duplicate', 'digits': 'digit', 'attributes': 'attribute',
+    'operations': 'operation', 'values': 'value', 'adds': 'add',
+    'subtracts': 'subtract', 'multiplies': 'multiply', 'divides': 'divide',
+    'using': 'use', 'given': 'give', 'are': 'be', 'is': 'be',
+}
+
+# One lowercase word, a digit run, or a single symbol per token
+_WORD_RE = re.compile(r'[a-z]+|[0-9]+|\S')
+
+class Token(NamedTuple):
+    """
+    Represents a token with its properties.
+
+    A NamedTuple rather than a dataclass: tokens are created in bulk
+    and never mutated, and the tuple layout drops the per-instance
+    __dict__ that a regular dataclass would carry.
+    """
     text: str
     pos: str  # Part of speech
     lemma: str
@@ -17,38 +83,186 @@ class Token:
     dep: str  # Dependency relation
     is_keyword: bool = False
 
+class Tokens(List[Token]):
+    """
+    Token list with cached derived views.
+
+    tokenize() returns this in place of a plain list. The keyword,
+    noun and verb views and the text set are computed on first access
+    and then reused — worthwhile because cached token lists are shared
+    across repeated compilations of the same instruction.
+    """
+
+    @cached_property
+    def keywords(self) -> List[Token]:
+        """Keyword tokens."""
+        return [t for t in self if t.is_keyword]
+
+    @cached_property
+    def nouns(self) -> List[Token]:
+        """NOUN/PROPN tokens."""
+        return [t for t in self if t.pos in ('NOUN', 'PROPN')]
+
+    @cached_property
+    def verbs(self) -> List[Token]:
+        """VERB tokens."""
+        return [t for t in self if t.pos == 'VERB']
+
+    @cached_property
+    def text_set(self) -> frozenset:
+        """Token texts as a set for O(1) membership checks."""
+        return frozenset(t.text for t in self)
+
+@dataclass
+class TokenBatch:
+    """
+    Tokens in structure-of-arrays layout.
+
+    Consumers that scan a single property (texts for pattern matching,
+    pos for noun/verb filtering) walk one homogeneous list instead of
+    dereferencing a Token object per element.
+    """
+    texts: List[str]
+    pos: List[str]
+    lemmas: List[str]
+    tags: List[str]
+    deps: List[str]
+    is_keyword: List[bool]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def keyword_indices(self) -> List[int]:
+        """Indices of keyword tokens."""
+        return [i for i, kw in enumerate(self.is_keyword) if kw]
+
+    def noun_indices(self) -> List[int]:
+        """Indices of noun tokens."""
+        return [i for i, p in enumerate(self.pos) if p in ('NOUN', 'PROPN')]
+
+    def verb_indices(self) -> List[int]:
+        """Indices of verb tokens."""
+        return [i for i, p in enumerate(self.pos) if p == 'VERB']
+
 class Tokenizer:
     """Handles lexical analysis of input text using spaCy."""
     
     # Keywords that are important for code generation
-    KEYWORDS = {
+    KEYWORDS = frozenset({
         'function', 'def', 'class', 'method', 'return', 'if', 'else', 'for', 'while',
         'in', 'is', 'and', 'or', 'not', 'with', 'as', 'import', 'from', 'create',
         'write', 'build', 'make', 'check', 'get', 'set', 'add', 'remove', 'find',
         'calculate', 'compute', 'display', 'show', 'print'
-    }
+    })
     
-    def __init__(self, nlp: Language):
+    # Upper bound on cached tokenizations; old entries are evicted LRU
+    _CACHE_SIZE = 1024
+
+    def __init__(self, nlp: Optional[Language] = None,
+                 prefer_rules: bool = True):
         """
         Initialize the tokenizer with a spaCy language model.
-        
+
         Args:
-            nlp (Language): Loaded spaCy language model
+            nlp (Language, optional): Loaded spaCy language model; may
+                be None to run purely rule-based
+            prefer_rules (bool): Use the table-driven tokenizer when
+                the whole instruction is in-vocabulary, reserving the
+                spaCy pipeline for unknown words
         """
         self.nlp = nlp
-    
+        self.prefer_rules = prefer_rules
+
+        # LRU cache of tokenize() results keyed on the lowercased input.
+        # Running the spaCy pipeline dominates compile time, and the
+        # compiler is typically fed the same short instructions
+        # repeatedly; tokens are never mutated downstream, so sharing
+        # the cached list is safe.
+        self._token_cache: "OrderedDict[str, List[Token]]" = OrderedDict()
+
     def tokenize(self, text: str) -> List[Token]:
         """
         Tokenize input text into a list of Token objects.
-        
+
         Args:
             text (str): Input text to tokenize
-            
+
         Returns:
             List[Token]: List of Token objects with linguistic properties
         """
-        doc = self.nlp(text.lower())
-        return [self._create_token(token) for token in doc]
+        key = text.lower()
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            self._token_cache.move_to_end(key)
+            return cached
+
+        words = _WORD_RE.findall(key)
+        if self.nlp is None or (self.prefer_rules and
+                                all(self._rule_known(w) for w in words)):
+            tokens = Tokens(self._rule_token(word) for word in words)
+        else:
+            doc = self.nlp(key)
+            # Bind the bound method once rather than resolving the
+            # attribute on every iteration of the hot loop
+            create = self._create_token
+            tokens = Tokens(create(token) for token in doc)
+        self._token_cache[key] = tokens
+        if len(self._token_cache) > self._CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+        return tokens
+
+    def tokenize_batch(self, text: str) -> TokenBatch:
+        """
+        Tokenize input text into structure-of-arrays form.
+
+        Shares the tokenize() cache; only the per-call list views are
+        rebuilt.
+
+        Args:
+            text (str): Input text to tokenize
+
+        Returns:
+            TokenBatch: Parallel per-property lists for all tokens
+        """
+        tokens = self.tokenize(text)
+        return TokenBatch(
+            texts=[t.text for t in tokens],
+            pos=[t.pos for t in tokens],
+            lemmas=[t.lemma for t in tokens],
+            tags=[t.tag for t in tokens],
+            deps=[t.dep for t in tokens],
+            is_keyword=[t.is_keyword for t in tokens]
+        )
+
+    @staticmethod
+    def _rule_known(word: str) -> bool:
+        """Whether a word can be tagged without the spaCy pipeline."""
+        return word in _POS_TABLE or not word.isalpha()
+
+    def _rule_token(self, word: str) -> Token:
+        """
+        Build a Token from the lookup tables, bypassing spaCy.
+
+        Args:
+            word (str): Lowercased word, digit run, or symbol
+
+        Returns:
+            Token: Token with table-derived linguistic properties
+        """
+        if word.isdigit():
+            pos = 'NUM'
+        elif word.isalpha():
+            pos = _POS_TABLE.get(word, 'X')
+        else:
+            pos = 'PUNCT'
+        return Token(
+            text=word,
+            pos=pos,
+            lemma=_LEMMA_TABLE.get(word, word),
+            tag='',
+            dep='',
+            is_keyword=word in self.KEYWORDS
+        )
     
     def _create_token(self, token) -> Token:
         """
@@ -66,7 +280,9 @@ class Tokenizer:
             lemma=token.lemma_,
             tag=token.tag_,
             dep=token.dep_,
-            is_keyword=token.text.lower() in self.KEYWORDS
+            # The Doc is built from the lowercased input, so the text
+            # needs no second .lower() here
+            is_keyword=token.text in self.KEYWORDS
         )
     
     def get_keywords(self, tokens: List[Token]) -> List[Token]:
@@ -79,6 +295,8 @@ class Tokenizer:
         Returns:
             List[Token]: List of keyword tokens
         """
+        if isinstance(tokens, Tokens):
+            return tokens.keywords
         return [token for token in tokens if token.is_keyword]
     
     def get_nouns(self, tokens: List[Token]) -> List[Token]:
@@ -91,6 +309,8 @@ class Tokenizer:
         Returns:
             List[Token]: List of noun tokens
         """
+        if isinstance(tokens, Tokens):
+            return tokens.nouns
         return [token for token in tokens if token.pos in {'NOUN', 'PROPN'}]
     
     def get_verbs(self, tokens: List[Token]) -> List[Token]:
@@ -103,4 +323,6 @@ class Tokenizer:
         Returns:
             List[Token]: List of verb tokens
         """
-        return [token for token in tokens if token.pos == 'VERB'] 
\ No newline at end of file
+        if isinstance(tokens, Tokens):
+            return tokens.verbs
+        return [token for token in tokens if token.pos == 'VERB']
\ No newline at end of file
@@ -2,10 +2,26 @@
 Parser component that handles syntax analysis and builds a parse tree.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from ..lexer.tokenizer import Token
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..lexer.tokenizer import Token, Tokens, Tokenizer
+
+# Pattern opcodes: a literal compares by word, STAR consumes a run of
+# tokens, OPT matches zero tokens. Patterns are compiled to these once
+# at construction so matching dispatches on small ints.
+_LIT, _STAR, _OPT = 0, 1, 2
+
+# Arithmetic operations recognized in function instructions
+_OPERATIONS = frozenset({'add', 'subtract', 'multiply', 'divide'})
 
 class NodeType(Enum):
     """Types of nodes in the parse tree."""
@@ -20,17 +36,39 @@ class NodeType(Enum):
     OPERATION = "operation"
     ROOT = "root"
 
-@dataclass
-class ParseNode:
-    """Node in the parse tree."""
+class ParseNode(NamedTuple):
+    """
+    Node in the parse tree.
+
+    Fields are fixed at construction (children/metadata are still
+    appended to in place); the NamedTuple layout avoids a per-node
+    __dict__.
+    """
     type: NodeType
     tokens: List[Token]
     children: List['ParseNode']
     metadata: Dict[str, Any]
 
+@dataclass
+class _Scan:
+    """
+    Landmark indices collected in one pass over a token list.
+
+    The _extract_* helpers each used to rescan the full list; sharing
+    one _Scan per parsed node reduces that to a single sweep.
+    """
+    op: Optional[str]         # first arithmetic-operation lemma
+    nouns: List[int]          # indices of NOUN/PROPN tokens
+    class_idx: Optional[int]  # index of the word 'class'
+    attrs_idx: Optional[int]  # index of the word 'attributes'
+    method_idxs: List[int]    # indices of the word 'method'
+
 class Parser:
     """Handles syntax analysis and builds a parse tree."""
-    
+
+    # Upper bound on cached parses; old entries are evicted LRU
+    _CACHE_SIZE = 512
+
     def __init__(self):
         """Initialize the parser with grammar rules."""
         # Define patterns for different types of instructions
@@ -85,7 +123,89 @@ class Parser:
         
         # Articles and other words to skip in pattern matching
         self.skip_words = {'a', 'an', 'the', 'some', 'any', 'from', 'given'}
-        
+
+        # Intern every pattern literal and skip word to a small int id;
+        # id 0 is reserved for off-vocabulary tokens. Matching then
+        # compares ints rather than hashing strings, and an unknown
+        # token (0) can never equal a literal (ids start at 1).
+        self._vocab: Dict[str, int] = {}
+        for instr_type, patterns in self.patterns.items():
+            for pattern in patterns:
+                for element in pattern:
+                    if element not in ('*', '?') and element not in self._vocab:
+                        self._vocab[element] = len(self._vocab) + 1
+        for word in sorted(self.skip_words):
+            if word not in self._vocab:
+                self._vocab[word] = len(self._vocab) + 1
+        self._skip_ids = frozenset(self._vocab[w] for w in self.skip_words)
+
+        # Every pattern compiled once (see _compile_pattern), in
+        # self.patterns order — the order matches are reported in.
+        # self.patterns itself stays the readable spec.
+        self._all_patterns: List[tuple] = []
+        for instr_type, patterns in self.patterns.items():
+            for pattern in patterns:
+                self._all_patterns.append(
+                    (instr_type, self._compile_pattern(pattern)))
+
+        # Literal-prefix trie: many patterns share long prefixes
+        # ('write ? python ? code ...'), so their effective literal
+        # prefixes (literals before the first STAR; OPT consumes
+        # nothing and is dropped) collapse into shared trie paths.
+        # Each node records the patterns whose prefix ends there; a
+        # walk over the token ids collects those as candidates, which
+        # _identify_instruction_type confirms with _match_pattern, so
+        # a shared prefix is compared once however many patterns it
+        # leads.
+        self._trie: Dict[str, Any] = {'kids': {}, 'pats': []}
+        for idx, (instr_type, compiled) in enumerate(self._all_patterns):
+            node = self._trie
+            for op, lit in compiled:
+                if op == _STAR:
+                    break
+                if op == _OPT:
+                    continue
+                node = node['kids'].setdefault(lit,
+                                               {'kids': {}, 'pats': []})
+            node['pats'].append(idx)
+
+        # Bulk prefix prefilter: one matrix row per pattern holding its
+        # leading literal ids in token position (OPT consumes nothing
+        # and is dropped; everything from the first STAR on, and past
+        # the pattern end, is -1 = match anything). Comparing the
+        # matrix against the first tokens finds every candidate row in
+        # a single vectorized pass; each candidate is then confirmed by
+        # _match_pattern, so the filter only has to avoid false
+        # negatives.
+        if np is not None:
+            width = max(len(c) for _, c in self._all_patterns)
+            mat = np.full((len(self._all_patterns), width), -1,
+                          dtype=np.int64)
+            for row, (_, compiled) in enumerate(self._all_patterns):
+                col = 0
+                for op, lit in compiled:
+                    if op == _STAR:
+                        break
+                    if op == _OPT:
+                        continue
+                    mat[row, col] = lit
+                    col += 1
+            self._prefix_mat = mat
+        else:
+            self._prefix_mat = None
+
+        # Required-literal id sets for the flexible pass: a pattern can
+        # only flex-match when every non-wildcard element occurs in the
+        # token set, so the nested all/any scan becomes one subset test
+        self._pattern_req: List[tuple] = []
+        for instr_type, patterns in self.patterns.items():
+            for pattern in patterns:
+                req = frozenset(self._vocab[p] for p in pattern
+                                if p not in ('*', '?'))
+                if req:
+                    self._pattern_req.append((instr_type, req))
+
+
         # Common prompt variations and their corrections
         self.prompt_variations = {
             'write python code': 'write a python code to',
@@ -96,7 +216,29 @@ class Parser:
             'create code': 'create a python code to',
             'build code': 'build a python code to',
         }
-    
+
+        # All variations compiled into one alternation so the fix-up
+        # scans the text once instead of once per entry. Longer keys
+        # come first so 'write python code' wins over 'write python'
+        # at the same position, and the word boundaries keep a
+        # variation from firing on a fragment inside a longer word.
+        self._variation_re = re.compile(r'\b(?:' + '|'.join(
+            re.escape(v) for v in
+            sorted(self.prompt_variations, key=len, reverse=True)) + r')\b')
+
+        # Rule-only tokenizer (no spaCy model) for re-tokenizing
+        # corrected prompts: every correction is built from
+        # in-vocabulary words, so the table-driven path yields real
+        # POS tags and lemmas without a model call
+        self._fix_tokenizer = Tokenizer()
+
+        # LRU cache of parsed instruction nodes keyed on the token
+        # texts. An instruction node is never mutated after parse
+        # (parse only appends to a fresh root), so the cached child can
+        # be shared across calls under a new root wrapper.
+        self._parse_cache: "OrderedDict[Tuple[str, ...], ParseNode]" = \
+            OrderedDict()
+
     def parse(self, tokens: List[Token]) -> ParseNode:
         """
         Parse tokens into a parse tree.
@@ -111,23 +253,34 @@ class Parser:
             ParseError: If the input cannot be parsed
         """
         root = ParseNode(NodeType.ROOT, tokens, [], {})
-        
-        # Filter out articles and other skip words
-        filtered_tokens = [t for t in tokens if t.text.lower() not in self.skip_words]
+
+        key = tuple(t.text for t in tokens)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            root.children.append(cached)
+            return root
+
+        # Filter out articles and other skip words; token text arrives
+        # lowercased from the tokenizer
+        filtered_tokens = [t for t in tokens if t.text not in self.skip_words]
         
         # Try to identify the instruction type
         instruction_type = self._identify_instruction_type(filtered_tokens)
         
-        # If instruction type not found, try to fix common prompt variations
+        # If instruction type not found, try to fix common prompt
+        # variations. The joined text is built once here and shared by
+        # the fix-up and suggestion helpers.
         if not instruction_type:
-            fixed_tokens = self._fix_common_prompt_variations(tokens)
+            token_text = ' '.join(t.text for t in tokens)
+            fixed_tokens = self._fix_common_prompt_variations(token_text)
             if fixed_tokens:
-                filtered_tokens = [t for t in fixed_tokens if t.text.lower() not in self.skip_words]
+                filtered_tokens = [t for t in fixed_tokens if t.text not in self.skip_words]
                 instruction_type = self._identify_instruction_type(filtered_tokens)
                 if instruction_type:
                     tokens = fixed_tokens
                 else:
-                    self._suggest_prompt_fixes(tokens)
+                    self._suggest_prompt_fixes(tokens, token_text)
         
         if not instruction_type:
             raise ParseError("Could not identify instruction type")
@@ -143,102 +296,138 @@ class Parser:
             raise ParseError(f"Unsupported instruction type: {instruction_type}")
         
         root.children.append(node)
+        self._parse_cache[key] = node
+        if len(self._parse_cache) > self._CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
         return root
     
-    def _fix_common_prompt_variations(self, tokens: List[Token]) -> Optional[List[Token]]:
+    def _fix_common_prompt_variations(self, token_text: str) -> Optional[List[Token]]:
         """
         Try to fix common prompt variations.
-        
+
         Args:
-            tokens (List[Token]): List of tokens
-            
+            token_text (str): Joined lowercased token text from parse
+
         Returns:
             Optional[List[Token]]: Fixed tokens if a variation was found, None otherwise
         """
-        # Convert tokens to lowercase string for matching
-        token_text = ' '.join(t.text.lower() for t in tokens)
-        
-        # Check for common variations
-        for variation, correction in self.prompt_variations.items():
-            if variation in token_text:
-                # Replace the variation with the correction
-                corrected_text = token_text.replace(variation, correction)
-                # Create new tokens from the corrected text
-                return [Token(text=word, pos='', lemma='', tag='', dep='', is_keyword=False) 
-                       for word in corrected_text.split()]
-        
+        # One pass over the text replaces every known variation with
+        # its correction; the compiled alternation makes the cost
+        # independent of how many variations are registered
+        corrected_text, n = self._variation_re.subn(
+            lambda m: self.prompt_variations[m.group(0)], token_text)
+        if n:
+            # Re-tokenize through the rule-only tokenizer so the fixed
+            # tokens carry POS tags and lemmas (the old synthetic
+            # Token(pos='', lemma='') objects broke the _extract_*
+            # helpers downstream); repeats hit its LRU cache
+            return self._fix_tokenizer.tokenize(corrected_text)
+
         return None
     
-    def _suggest_prompt_fixes(self, tokens: List[Token]):
+    def _suggest_prompt_fixes(self, tokens: List[Token], token_text: str):
         """
         Suggest fixes for the prompt.
-        
+
         Args:
             tokens (List[Token]): List of tokens
+            token_text (str): Joined lowercased token text from parse
         """
-        token_text = ' '.join(t.text.lower() for t in tokens)
-        
+        # Whole-word membership via the token set; the old substring
+        # scans could fire on fragments inside unrelated words
+        if isinstance(tokens, Tokens):
+            text_set = tokens.text_set
+        else:
+            text_set = frozenset(t.text for t in tokens)
+
         # Check for missing 'to' after 'code'
-        if 'code' in token_text and 'to' not in token_text:
+        if 'code' in text_set and 'to' not in text_set:
             raise ParseError("Please add 'to' after 'code' in your instruction. For example: 'Write a python code to divide two numbers'")
-        
+
         # Check for missing 'python code'
-        if 'write' in token_text and 'python' not in token_text and 'code' not in token_text:
+        if 'write' in text_set and 'python' not in text_set and 'code' not in text_set:
             raise ParseError("Please specify 'python code' in your instruction. For example: 'Write a python code to divide two numbers'")
-        
+
         # Check for missing operation
-        if 'numbers' in token_text and not any(op in token_text for op in ['add', 'subtract', 'multiply', 'divide']):
+        if 'numbers' in text_set and not (_OPERATIONS & text_set):
             raise ParseError("Please specify the operation (add, subtract, multiply, or divide) in your instruction. For example: 'Write a python code to divide two numbers'")
-        
+
         # Generic error message
         raise ParseError("Please use a complete instruction. For example: 'Write a python code to divide two numbers'")
     
-    def _match_pattern(self, token_texts: List[str], pattern: List[str]) -> bool:
+    def _compile_pattern(self, pattern: List[str]) -> List[Tuple[int, int]]:
         """
-        Check if token texts match a pattern with improved flexibility.
-        
+        Compile a string pattern into (opcode, literal-id) pairs.
+
         Args:
-            token_texts (List[str]): List of token texts
-            pattern (List[str]): Pattern to match against
-            
+            pattern (List[str]): Pattern as written in self.patterns
+
+        Returns:
+            List[Tuple[int, int]]: Opcode form; the literal id is -1
+                for STAR and OPT so it never equals a token id
+        """
+        compiled = []
+        for element in pattern:
+            if element == '*':
+                compiled.append((_STAR, -1))
+            elif element == '?':
+                compiled.append((_OPT, -1))
+            else:
+                compiled.append((_LIT, self._vocab[element]))
+        return compiled
+
+    def _match_pattern(self, token_ids: List[int],
+                       pattern: List[Tuple[int, int]]) -> bool:
+        """
+        Check if interned token ids match a compiled pattern.
+
+        Args:
+            token_ids (List[int]): Token texts interned via self._vocab
+                (0 for off-vocabulary words)
+            pattern (List[Tuple[int, int]]): Compiled pattern from
+                _compile_pattern
+
         Returns:
             bool: True if pattern matches
         """
-        if len(token_texts) < len(pattern):
+        tlen = len(token_ids)
+        plen = len(pattern)
+        if tlen < plen:
             return False
-        
-        pattern_idx = 0
-        text_idx = 0
-        
-        while pattern_idx < len(pattern) and text_idx < len(token_texts):
-            if pattern[pattern_idx] == '*':
-                # '*' matches any sequence of tokens until the next pattern element
-                if pattern_idx == len(pattern) - 1:
+
+        skip_ids = self._skip_ids
+        pi = 0
+        ti = 0
+
+        while pi < plen and ti < tlen:
+            op, word = pattern[pi]
+            if op == _STAR:
+                # STAR matches any sequence of tokens until the next
+                # pattern element
+                if pi == plen - 1:
                     return True
-                next_pattern = pattern[pattern_idx + 1]
-                while text_idx < len(token_texts):
-                    if token_texts[text_idx] == next_pattern:
-                        pattern_idx += 1
+                nxt = pattern[pi + 1][1]
+                while ti < tlen:
+                    if token_ids[ti] == nxt:
+                        pi += 1
                         break
-                    text_idx += 1
-                if text_idx == len(token_texts):
+                    ti += 1
+                if ti == tlen:
                     return False
-            elif pattern[pattern_idx] == '?':
-                # '?' matches an optional token
-                pattern_idx += 1
-                continue
-            elif pattern[pattern_idx] == token_texts[text_idx]:
-                pattern_idx += 1
-                text_idx += 1
-            else:
+            elif op == _OPT:
+                # OPT matches an optional token
+                pi += 1
+            elif word == token_ids[ti]:
+                pi += 1
+                ti += 1
+            elif token_ids[ti] in skip_ids:
                 # Skip articles and other skip words
-                if token_texts[text_idx] in self.skip_words:
-                    text_idx += 1
-                    continue
+                ti += 1
+            else:
                 return False
-        
+
         # Check if we've matched all pattern elements
-        return pattern_idx == len(pattern) or (pattern_idx == len(pattern) - 1 and pattern[-1] == '*')
+        return pi == plen or (pi == plen - 1 and pattern[-1][0] == _STAR)
     
     def _identify_instruction_type(self, tokens: List[Token]) -> Optional[str]:
         """
@@ -250,38 +439,115 @@ class Parser:
         Returns:
             Optional[str]: Type of instruction or None if not recognized
         """
-        token_texts = [t.text.lower() for t in tokens]
-        
-        # First, try exact pattern matching
-        for instr_type, patterns in self.patterns.items():
-            for pattern in patterns:
-                if self._match_pattern(token_texts, pattern):
-                    return instr_type
-        
-        # If no exact match, try flexible matching
-        for instr_type, patterns in self.patterns.items():
-            for pattern in patterns:
-                # Check if all non-wildcard pattern elements are present in the tokens
-                pattern_elements = [p for p in pattern if p not in ['*', '?']]
-                if pattern_elements and all(any(p == t for t in token_texts) for p in pattern_elements):
-                    return instr_type
-        
+        # Intern once per query; every comparison below is on ints
+        vocab_get = self._vocab.get
+        token_ids = [vocab_get(t.text, 0) for t in tokens]
+
+        # First, try exact pattern matching. With the prefix matrix
+        # available and no skip words left in the input (parse filters
+        # them before identification), one broadcast compare yields the
+        # candidate patterns; -2 pads the token vector so positions
+        # past the input match only wildcard cells. Otherwise walk the
+        # literal-prefix trie, branching where a skip word may either
+        # match a literal or be skipped. Both generators over-approve;
+        # every candidate is confirmed by _match_pattern in pattern
+        # order.
+        if self._prefix_mat is not None and \
+                self._skip_ids.isdisjoint(token_ids):
+            width = self._prefix_mat.shape[1]
+            tok = np.full(width, -2, dtype=np.int64)
+            head = token_ids[:width]
+            tok[:len(head)] = head
+            hits = ((self._prefix_mat == tok) |
+                    (self._prefix_mat == -1)).all(axis=1)
+            candidates = np.flatnonzero(hits)
+        else:
+            skip_ids = self._skip_ids
+            tlen = len(token_ids)
+            found = set()
+            frontier = [(self._trie, 0)]
+            seen = {(id(self._trie), 0)}
+            while frontier:
+                node, ti = frontier.pop()
+                found.update(node['pats'])
+                if ti >= tlen:
+                    continue
+                tid = token_ids[ti]
+                child = node['kids'].get(tid)
+                if child is not None:
+                    key = (id(child), ti + 1)
+                    if key not in seen:
+                        seen.add(key)
+                        frontier.append((child, ti + 1))
+                if tid in skip_ids:
+                    key = (id(node), ti + 1)
+                    if key not in seen:
+                        seen.add(key)
+                        frontier.append((node, ti + 1))
+            candidates = sorted(found)
+
+        for idx in candidates:
+            instr_type, pattern = self._all_patterns[idx]
+            if self._match_pattern(token_ids, pattern):
+                return instr_type
+
+        # If no exact match, try flexible matching: all non-wildcard
+        # pattern elements present, order-insensitive
+        id_set = set(token_ids)
+        for instr_type, req in self._pattern_req:
+            if req.issubset(id_set):
+                return instr_type
+
         return None
     
+    @staticmethod
+    def _scan_tokens(tokens: List[Token]) -> _Scan:
+        """
+        Collect the landmarks the _extract_* helpers need in one pass.
+
+        Args:
+            tokens (List[Token]): List of tokens
+
+        Returns:
+            _Scan: Landmark indices for this token list
+        """
+        op = None
+        nouns = []
+        class_idx = None
+        attrs_idx = None
+        method_idxs = []
+        for i, token in enumerate(tokens):
+            # Token text arrives lowercased from the tokenizer
+            text = token.text
+            if token.pos in ('NOUN', 'PROPN'):
+                nouns.append(i)
+            if op is None and token.lemma.lower() in _OPERATIONS:
+                op = token.lemma.lower()
+            if class_idx is None and text == 'class':
+                class_idx = i
+            if attrs_idx is None and text == 'attributes':
+                attrs_idx = i
+            if text == 'method':
+                method_idxs.append(i)
+        return _Scan(op=op, nouns=nouns, class_idx=class_idx,
+                     attrs_idx=attrs_idx, method_idxs=method_idxs)
+
     def _parse_function(self, tokens: List[Token]) -> ParseNode:
         """
         Parse function definition tokens.
-        
+
         Args:
             tokens (List[Token]): List of tokens
-            
+
         Returns:
             ParseNode: Function node
         """
+        scan = self._scan_tokens(tokens)
+
         # Extract function name and purpose
-        name = self._extract_function_name(tokens)
+        name = self._extract_function_name(tokens, scan)
         purpose = self._extract_function_purpose(tokens)
-        
+
         return ParseNode(
             type=NodeType.FUNCTION,
             tokens=tokens,
@@ -289,7 +555,7 @@ class Parser:
             metadata={
                 'name': name,
                 'purpose': purpose,
-                'parameters': self._extract_parameters(tokens),
+                'parameters': self._extract_parameters(scan),
                 'return_type': self._infer_return_type(tokens)
             }
         )
@@ -304,10 +570,12 @@ class Parser:
         Returns:
             ParseNode: Class node
         """
+        scan = self._scan_tokens(tokens)
+
         # Extract class name and attributes
-        name = self._extract_class_name(tokens)
-        attributes = self._extract_attributes(tokens)
-        
+        name = self._extract_class_name(tokens, scan)
+        attributes = self._extract_attributes(tokens, scan)
+
         return ParseNode(
             type=NodeType.CLASS,
             tokens=tokens,
@@ -315,7 +583,7 @@ class Parser:
             metadata={
                 'name': name,
                 'attributes': attributes,
-                'methods': self._extract_methods(tokens)
+                'methods': self._extract_methods(tokens, scan)
             }
         )
     
@@ -329,10 +597,12 @@ class Parser:
         Returns:
             ParseNode: Method node
         """
+        scan = self._scan_tokens(tokens)
+
         # Extract method name and purpose
         name = self._extract_method_name(tokens)
         purpose = self._extract_method_purpose(tokens)
-        
+
         return ParseNode(
             type=NodeType.METHOD,
             tokens=tokens,
@@ -340,27 +610,22 @@ class Parser:
             metadata={
                 'name': name,
                 'purpose': purpose,
-                'parameters': self._extract_parameters(tokens),
+                'parameters': self._extract_parameters(scan),
                 'return_type': self._infer_return_type(tokens)
             }
         )
     
-    def _extract_function_name(self, tokens: List[Token]) -> str:
+    def _extract_function_name(self, tokens: List[Token],
+                               scan: _Scan) -> str:
         """Extract function name from tokens."""
         # Try to extract operation and objects (e.g., add two numbers)
-        operations = {'add', 'subtract', 'multiply', 'divide'}
-        op = None
-        for token in tokens:
-            if token.lemma.lower() in operations:
-                op = token.lemma.lower()
-                break
-        if op:
+        if scan.op:
             # Try to find what is being operated on (e.g., numbers)
-            nouns = [t.text for t in tokens if t.pos in ('NOUN', 'PROPN')]
-            if nouns:
-                return f"{op}_{'_'.join(nouns)}"
+            if scan.nouns:
+                nouns = '_'.join(tokens[i].text for i in scan.nouns)
+                return f"{scan.op}_{nouns}"
             else:
-                return f"{op}_numbers"
+                return f"{scan.op}_numbers"
         return "generated_function"
     
     def _extract_function_purpose(self, tokens: List[Token]) -> str:
@@ -368,11 +633,10 @@ class Parser:
         # Implementation depends on specific patterns
         return " ".join(t.text for t in tokens)
     
-    def _extract_parameters(self, tokens: List[Token]) -> List[Dict[str, str]]:
-        """Extract function/method parameters from tokens."""
+    def _extract_parameters(self, scan: _Scan) -> List[Dict[str, str]]:
+        """Extract function/method parameters from the token scan."""
         # For arithmetic operations, expect two numbers
-        operations = {'add', 'subtract', 'multiply', 'divide'}
-        if any(token.lemma.lower() in operations for token in tokens):
+        if scan.op:
             return [
                 {'name': 'a', 'type': 'int'},
                 {'name': 'b', 'type': 'int'}
@@ -384,53 +648,57 @@ class Parser:
         # Implementation depends on specific patterns
         return "Any"
     
-    def _extract_class_name(self, tokens: List[Token]) -> str:
+    def _extract_class_name(self, tokens: List[Token], scan: _Scan) -> str:
         """Extract class name from tokens."""
         # Try to find the first proper noun or noun after 'class'
-        found_class = False
-        for token in tokens:
-            if found_class and token.pos in ('PROPN', 'NOUN'):
-                return token.text.capitalize()
-            if token.text.lower() == 'class':
-                found_class = True
+        if scan.class_idx is not None:
+            for i in scan.nouns:
+                if i > scan.class_idx:
+                    return tokens[i].text.capitalize()
         return "GeneratedClass"
     
-    def _extract_attributes(self, tokens: List[Token]) -> List[Dict[str, str]]:
-        # Look for "attributes" and collect nouns after it until "method" or end
+    def _extract_attributes(self, tokens: List[Token],
+                            scan: _Scan) -> List[Dict[str, str]]:
+        # Attributes are the nouns after "attributes" up to the next
+        # "method" or the end
+        if scan.attrs_idx is None:
+            return []
+        end = len(tokens)
+        for m in scan.method_idxs:
+            if m > scan.attrs_idx:
+                end = m
+                break
         attrs = []
-        collecting = False
-        for token in tokens:
-            if token.text.lower() == "attributes":
-                collecting = True
-                continue
-            if collecting:
-                if token.text.lower() == "method":
-                    break
-                if token.pos in ("NOUN", "PROPN"):
-                    # Guess type: if "salary" in name, use float, else str
-                    attr_type = "float" if "salary" in token.text.lower() else "str"
-                    attrs.append({"name": token.text, "type": attr_type})
+        for i in scan.nouns:
+            if scan.attrs_idx < i < end:
+                name = tokens[i].text
+                # A repeated "attributes" is a marker, not an attribute
+                if name == "attributes":
+                    continue
+                # Guess type: if "salary" in name, use float, else str
+                attr_type = "float" if "salary" in name else "str"
+                attrs.append({"name": name, "type": attr_type})
         return attrs
     
-    def _extract_methods(self, tokens: List[Token]) -> List[Dict[str, str]]:
-        # Look for "method" and collect the next noun as method name.
-        # If the next noun is "details" and the previous token is a verb (like "display"), then join them as "display_details".
+    def _extract_methods(self, tokens: List[Token],
+                         scan: _Scan) -> List[Dict[str, str]]:
+        # Each "method" names the next noun as a method.
+        # If that noun is "details" and the previous token is a verb
+        # (like "display"), join them as "display_details".
         methods = []
-        for i, token in enumerate(tokens):
-            if token.text.lower() == "method":
-                # Next NOUN/PROPN is method name
-                for j in range(i+1, len(tokens)):
-                    if tokens[j].pos in ("NOUN", "PROPN"):
-                        method_name = tokens[j].text
-                        # If the next noun is "details" and the previous token (if any) is a verb, join them.
-                        if (method_name.lower() == "details" and (j-1) >= 0 and tokens[j-1].pos == "VERB"):
-                            method_name = tokens[j-1].text + "_" + method_name
-                        methods.append({
-                            "name": method_name,
-                            "parameters": [],
-                            "return_type": "str"
-                        })
-                        break
+        for i in scan.method_idxs:
+            for j in scan.nouns:
+                if j > i:
+                    method_name = tokens[j].text
+                    if (method_name == "details" and
+                            tokens[j - 1].pos == "VERB"):
+                        method_name = tokens[j - 1].text + "_" + method_name
+                    methods.append({
+                        "name": method_name,
+                        "parameters": [],
+                        "return_type": "str"
+                    })
+                    break
         return methods
     
     def _extract_method_name(self, tokens: List[Token]) -> str:
@@ -2,13 +2,27 @@
 Semantic analyzer component that interprets the meaning of instructions.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+import logging
+import re
+import sys
 from ..parser.parser import ParseNode, NodeType
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
 class SemanticInfo:
-    """Semantic information extracted from parse tree."""
+    """
+    Semantic information extracted from parse tree.
+
+    Frozen: instances are shared through the analyze() cache, so no
+    consumer may rebind fields. slots would shrink them further but
+    needs Python 3.10, beyond what setup.py supports.
+    """
     type: str  # Type of code to generate (function, class, method)
     name: str  # Name of the function/class/method
     parameters: List[Dict[str, str]]  # Parameters with types
@@ -16,13 +30,52 @@ class SemanticInfo:
     implementation: Dict[str, Any]  # Implementation details
     docstring: str  # Documentation string
 
-class SemanticAnalyzer:
-    """Analyzes semantic meaning of parsed instructions."""
-    
-    def __init__(self):
-        """Initialize the semantic analyzer with common patterns."""
-        self.context = {}  # Additional context for analysis
-        self.implementation_patterns = {
+# Shared pieces of the generic-fallback SemanticInfo. Purposes that
+# match no pattern all describe the same placeholder function, so the
+# parameter spec and implementation record are module constants rather
+# than fresh allocations per miss. A single SemanticInfo per pattern
+# cannot be shared the same way: the docstring embeds the instruction
+# text and the generator dispatches on it, so complete results are
+# instead shared per purpose through the analyze() cache.
+_GENERIC_PARAMETERS = [{'name': 'n', 'type': 'int'}]
+_GENERIC_IMPLEMENTATION = MappingProxyType({'algorithm': 'generic'})
+
+def _main_scaffold(body: str) -> str:
+    """
+    Wrap a template's interactive try-body in the shared main() driver.
+
+    Every runnable template used to carry its own copy of the same
+    def main()/try/except/__main__ scaffold; only the lines inside the
+    try block differ. Splicing the body into one shared scaffold keeps
+    each template down to its unique part. Plain concatenation rather
+    than str.format, because the bodies are full of f-string braces.
+    """
+    return (
+        '\ndef main():\n'
+        '    try:\n'
+        + body +
+        '\n    except Exception as e:\n'
+        '        print(f"Error: {str(e)}")\n'
+        '\n'
+        'if __name__ == "__main__":\n'
+        '    main()\n'
+    )
+
+@lru_cache(maxsize=1)
+def _load_patterns() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Build the implementation-pattern table on first use.
+
+    The table holds dozens of nested dicts carrying multi-kilobyte
+    template strings; constructing it lazily at module level and
+    sharing the result means creating a SemanticAnalyzer no longer
+    rebuilds the whole thing per instance. Because it is shared, the
+    table is returned read-only: pattern dicts are wrapped in
+    MappingProxyType so no caller can mutate another's view, and
+    keywords are interned so membership checks against them compare
+    by pointer first.
+    """
+    patterns = {
             'odd_even': {
                 'type': 'function',
                 'name': 'check_odd_even',
@@ -41,6 +94,7 @@ class SemanticAnalyzer:
                 'return_type': 'bool',
                 'implementation': {
                     'algorithm': 'prime_check',
+                    'is_numeric': True,
                     'complexity': 'O(sqrt(n))'
                 },
                 'keywords': ['prime', 'primality']
@@ -63,6 +117,7 @@ class SemanticAnalyzer:
                 'return_type': 'bool',
                 'implementation': {
                     'algorithm': 'armstrong',
+                    'is_numeric': True,
                     'complexity': 'O(d)'  # d is number of digits
                 },
                 'keywords': ['armstrong', 'narcissistic']
@@ -168,6 +223,7 @@ class SemanticAnalyzer:
                 'return_type': 'int',
                 'implementation': {
                     'algorithm': 'factorial',
+                    'is_numeric': True,
                     'complexity': 'O(n)'
                 },
                 'keywords': ['factorial', 'calculate factorial']
@@ -190,6 +246,7 @@ class SemanticAnalyzer:
                 'return_type': 'int',
                 'implementation': {
                     'algorithm': 'list_sum',
+                    'is_numeric': True,
                     'complexity': 'O(n)'
                 },
                 'keywords': ['sum list', 'sum elements', 'sum all elements']
@@ -201,6 +258,7 @@ class SemanticAnalyzer:
                 'return_type': 'int',
                 'implementation': {
                     'algorithm': 'list_max',
+                    'is_numeric': True,
                     'complexity': 'O(n)'
                 },
                 'keywords': ['find maximum', 'find max', 'maximum element']
@@ -226,6 +284,7 @@ class SemanticAnalyzer:
                 'return_type': 'int',
                 'implementation': {
                     'algorithm': 'gcd',
+                    'is_numeric': True,
                     'complexity': 'O(log(min(a,b)))'
                 },
                 'keywords': ['greatest common divisor', 'gcd', 'highest common factor']
@@ -237,6 +296,7 @@ class SemanticAnalyzer:
                 'return_type': 'int',
                 'implementation': {
                     'algorithm': 'list_largest',
+                    'is_numeric': True,
                     'complexity': 'O(n)'
                 },
                 'keywords': ['largest number', 'find largest', 'maximum in list', 'largest in list']
@@ -248,6 +308,7 @@ class SemanticAnalyzer:
                 'return_type': 'int',
                 'implementation': {
                     'algorithm': 'list_smallest',
+                    'is_numeric': True,
                     'complexity': 'O(n)'
                 },
                 'keywords': ['smallest number', 'find smallest', 'minimum in list', 'smallest in list']
@@ -259,6 +320,7 @@ class SemanticAnalyzer:
                 'return_type': 'float',
                 'implementation': {
                     'algorithm': 'list_average',
+                    'is_numeric': True,
                     'complexity': 'O(n)'
                 },
                 'keywords': ['average', 'mean', 'average of a list', 'find average']
@@ -306,36 +368,34 @@ class SemanticAnalyzer:
                     'complexity': 'O(n)',
                     'template': '''from typing import Dict
 
+# 256-entry classification table: 1 = ASCII vowel, 2 = other ASCII
+# letter, 0 = everything else (including UTF-8 continuation bytes)
+_VOWEL_TBL = bytes(
+    1 if chr(i) in 'aeiouAEIOU' else (2 if i < 128 and chr(i).isalpha() else 0)
+    for i in range(256)
+)
+
 def count_vowels_consonants(text: str) -> Dict[str, int]:
     """
     Count the number of vowels and consonants in a string.
-    
+
+    Classifies every byte in one C-level translate pass, then counts
+    each class with a single scan instead of testing every character
+    against the vowel and consonant strings.
+
     Args:
         text (str): Input string
-        
+
     Returns:
         Dict[str, int]: Dictionary containing count of vowels and consonants
     """
-    vowels = 'aeiouAEIOU'
-    consonants = 'bcdfghjklmnpqrstvwxyzBCDFGHJKLMNPQRSTVWXYZ'
-    
-    vowel_count = sum(1 for char in text if char in vowels)
-    consonant_count = sum(1 for char in text if char in consonants)
-    
-    return {'vowels': vowel_count, 'consonants': consonant_count}
-
-def main():
-    try:
+    mapped = text.encode('utf-8', 'ignore').translate(_VOWEL_TBL)
+    return {'vowels': mapped.count(1), 'consonants': mapped.count(2)}
+''' + _main_scaffold('''\
         text = input("Enter a string: ")
         result = count_vowels_consonants(text)
         print(f"Vowels: {result['vowels']}")
-        print(f"Consonants: {result['consonants']}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Consonants: {result['consonants']}")''')
                 },
                 'keywords': ['count vowels', 'count consonants', 'vowels and consonants']
             },
@@ -350,52 +410,35 @@ if __name__ == "__main__":
                 'implementation': {
                     'algorithm': 'anagram_check',
                     'complexity': 'O(n)',
-                    'template': '''from typing import Dict
+                    'template': '''from collections import Counter
 
 def are_anagrams(str1: str, str2: str) -> bool:
     """
     Check if two strings are anagrams.
-    
+
     Args:
         str1 (str): First string
         str2 (str): Second string
-        
+
     Returns:
         bool: True if strings are anagrams, False otherwise
     """
     # Remove spaces and convert to lowercase
     str1 = ''.join(str1.lower().split())
     str2 = ''.join(str2.lower().split())
-    
-    # Check if lengths are equal
+
+    # Cheap length check before counting anything
     if len(str1) != len(str2):
         return False
-    
-    # Count character frequencies
-    char_count = {}
-    for char in str1:
-        char_count[char] = char_count.get(char, 0) + 1
-    
-    # Compare with second string
-    for char in str2:
-        if char not in char_count or char_count[char] == 0:
-            return False
-        char_count[char] -= 1
-    
-    return True
 
-def main():
-    try:
+    # Counter tallies each string in a single C-level loop; anagrams
+    # have identical character histograms
+    return Counter(str1) == Counter(str2)
+''' + _main_scaffold('''\
         str1 = input("Enter first string: ")
         str2 = input("Enter second string: ")
         result = are_anagrams(str1, str2)
-        print(f"Are anagrams: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Are anagrams: {result}")''')
                 },
                 'keywords': ['anagram', 'check anagrams', 'are anagrams']
             },
@@ -408,29 +451,31 @@ if __name__ == "__main__":
                     'algorithm': 'string_clean',
                     'complexity': 'O(n)',
                     'template': '''
+import string
+
+# Deletion table dropping every ASCII character that is not a letter;
+# str.translate walks it in one C scan
+_DEL = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if chr(i) not in string.ascii_letters))
+
 def remove_non_alpha(text: str) -> str:
     """
     Remove all non-alphabet characters from a string.
-    
+
     Args:
         text (str): Input string
-        
+
     Returns:
         str: String containing only alphabetic characters
     """
+    if text.isascii():
+        return text.translate(_DEL)
+    # Non-ASCII letters need the full Unicode isalpha test
     return ''.join(char for char in text if char.isalpha())
-
-def main():
-    try:
+''' + _main_scaffold('''\
         text = input("Enter a string: ")
         result = remove_non_alpha(text)
-        print(f"String with only alphabets: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"String with only alphabets: {result}")''')
                 },
                 'keywords': ['remove non alphabet', 'remove non alpha', 'only alphabet']
             },
@@ -457,18 +502,10 @@ def find_longest_word(sentence: str) -> str:
     if not words:
         return ""
     return max(words, key=len)
-
-def main():
-    try:
+''' + _main_scaffold('''\
         sentence = input("Enter a sentence: ")
         result = find_longest_word(sentence)
-        print(f"Longest word: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Longest word: {result}")''')
                 },
                 'keywords': ['longest word', 'find longest', 'maximum length word']
             },
@@ -491,19 +528,13 @@ def replace_spaces(text: str) -> str:
     Returns:
         str: String with spaces replaced by underscores
     """
+    # str.replace is already a single C-level scan; nothing to gain
+    # from anything fancier
     return text.replace(' ', '_')
-
-def main():
-    try:
+''' + _main_scaffold('''\
         text = input("Enter a string: ")
         result = replace_spaces(text)
-        print(f"String with spaces replaced: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"String with spaces replaced: {result}")''')
                 },
                 'keywords': ['replace spaces', 'space to underscore', 'spaces with underscore']
             },
@@ -515,36 +546,28 @@ if __name__ == "__main__":
                 'implementation': {
                     'algorithm': 'string_frequency',
                     'complexity': 'O(n)',
-                    'template': '''from typing import Dict
+                    'template': '''from collections import Counter
+from typing import Dict
 
 def count_char_frequency(text: str) -> Dict[str, int]:
     """
     Count the frequency of each character in a string.
-    
+
     Args:
         text (str): Input string
-        
+
     Returns:
         Dict[str, int]: Dictionary containing character frequencies
     """
-    frequency = {}
-    for char in text:
-        frequency[char] = frequency.get(char, 0) + 1
-    return frequency
-
-def main():
-    try:
+    # Counter counts in one C-level loop; convert back to a plain
+    # dict, which keeps first-occurrence order like the old loop did
+    return dict(Counter(text))
+''' + _main_scaffold('''\
         text = input("Enter a string: ")
         result = count_char_frequency(text)
         print("Character frequencies:")
         for char, freq in result.items():
-            print(f"'{char}': {freq}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+            print(f"'{char}': {freq}")''')
                 },
                 'keywords': ['character frequency', 'count characters', 'frequency of characters']
             },
@@ -567,19 +590,13 @@ def toggle_case(text: str) -> str:
     Returns:
         str: String with toggled case
     """
-    return ''.join(char.swapcase() for char in text)
-
-def main():
-    try:
+    # One C-level pass over the string instead of a generator that
+    # swaps and boxes each character separately
+    return text.swapcase()
+''' + _main_scaffold('''\
         text = input("Enter a string: ")
         result = toggle_case(text)
-        print(f"String with toggled case: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"String with toggled case: {result}")''')
                 },
                 'keywords': ['toggle case', 'switch case', 'change case']
             },
@@ -590,6 +607,7 @@ if __name__ == "__main__":
                 'return_type': 'Dict[str, int]',
                 'implementation': {
                     'algorithm': 'list_even_odd_count',
+                    'is_numeric': True,
                     'complexity': 'O(n)',
                     'template': '''from typing import List, Dict
 
@@ -600,19 +618,11 @@ def count_even_odd(numbers: List[int]) -> Dict[str, int]:
     even = sum(1 for n in numbers if n % 2 == 0)
     odd = sum(1 for n in numbers if n % 2 != 0)
     return {'even': even, 'odd': odd}
-
-def main():
-    try:
+''' + _main_scaffold('''\
         numbers = list(map(int, input("Enter numbers (space-separated): ").split()))
         result = count_even_odd(numbers)
         print(f"Even: {result['even']}")
-        print(f"Odd: {result['odd']}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Odd: {result['odd']}")''')
                 },
                 'keywords': ['even and odd', 'count even', 'count odd', 'even numbers', 'odd numbers']
             },
@@ -626,38 +636,27 @@ if __name__ == "__main__":
                 'return_type': 'List[int]',
                 'implementation': {
                     'algorithm': 'merge_sorted_lists',
+                    'is_numeric': True,
                     'complexity': 'O(n+m)',
-                    'template': '''from typing import List
+                    'template': '''import numpy as np
+from typing import List
 
 def merge_sorted_lists(list1: List[int], list2: List[int]) -> List[int]:
     """
     Merge two sorted lists into a single sorted list.
     """
-    i, j = 0, 0
-    merged = []
-    while i < len(list1) and j < len(list2):
-        if list1[i] < list2[j]:
-            merged.append(list1[i])
-            i += 1
-        else:
-            merged.append(list2[j])
-            j += 1
-    merged.extend(list1[i:])
-    merged.extend(list2[j:])
-    return merged
-
-def main():
-    try:
+    # Concatenating and running a stable mergesort keeps the O(n + m)
+    # merge work but moves it into one vectorized C pass; timsort's
+    # mergesort kind detects and merges the two presorted runs
+    merged = np.concatenate((np.asarray(list1, dtype=np.int64),
+                             np.asarray(list2, dtype=np.int64)))
+    merged.sort(kind='mergesort')
+    return merged.tolist()
+''' + _main_scaffold('''\
         list1 = list(map(int, input("Enter first sorted list (space-separated): ").split()))
         list2 = list(map(int, input("Enter second sorted list (space-separated): ").split()))
         result = merge_sorted_lists(list1, list2)
-        print(f"Merged list: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Merged list: {result}")''')
                 },
                 'keywords': ['merge sorted lists', 'merge lists', 'combine sorted lists']
             },
@@ -679,19 +678,11 @@ def remove_element(numbers: List[int], element: int) -> List[int]:
     Remove all occurrences of a specific element from a list.
     """
     return [n for n in numbers if n != element]
-
-def main():
-    try:
+''' + _main_scaffold('''\
         numbers = list(map(int, input("Enter numbers (space-separated): ").split()))
         element = int(input("Enter element to remove: "))
         result = remove_element(numbers, element)
-        print(f"List after removal: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"List after removal: {result}")''')
                 },
                 'keywords': ['remove element', 'remove all occurrences', 'delete element']
             },
@@ -711,19 +702,11 @@ def split_list_halves(numbers: List[int]) -> Tuple[List[int], List[int]]:
     """
     mid = len(numbers) // 2
     return numbers[:mid], numbers[mid:]
-
-def main():
-    try:
+''' + _main_scaffold('''\
         numbers = list(map(int, input("Enter numbers (space-separated): ").split()))
         first, second = split_list_halves(numbers)
         print(f"First half: {first}")
-        print(f"Second half: {second}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Second half: {second}")''')
                 },
                 'keywords': ['split list', 'two halves', 'divide list']
             },
@@ -734,26 +717,23 @@ if __name__ == "__main__":
                 'return_type': 'int',
                 'implementation': {
                     'algorithm': 'max_min_difference',
+                    'is_numeric': True,
                     'complexity': 'O(n)',
-                    'template': '''from typing import List
+                    'template': '''import numpy as np
+from typing import List
 
 def max_min_difference(numbers: List[int]) -> int:
     """
     Find the difference between the maximum and minimum elements in a list.
     """
-    return max(numbers) - min(numbers) if numbers else 0
-
-def main():
-    try:
+    # Both extremes come out of vectorized reductions over one
+    # contiguous int64 array instead of two Python-level scans
+    a = np.asarray(numbers, dtype=np.int64)
+    return int(a.max()) - int(a.min()) if a.size else 0
+''' + _main_scaffold('''\
         numbers = list(map(int, input("Enter numbers (space-separated): ").split()))
         result = max_min_difference(numbers)
-        print(f"Difference: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Difference: {result}")''')
                 },
                 'keywords': ['difference between maximum and minimum', 'max min difference', 'range of list']
             },
@@ -764,31 +744,24 @@ if __name__ == "__main__":
                 'return_type': 'Dict[int, int]',
                 'implementation': {
                     'algorithm': 'element_frequency',
+                    'is_numeric': True,
                     'complexity': 'O(n)',
-                    'template': '''from typing import List, Dict
+                    'template': '''from collections import Counter
+from typing import List, Dict
 
 def element_frequency(numbers: List[int]) -> Dict[int, int]:
     """
     Count the frequency of each element in a list.
     """
-    freq = {}
-    for n in numbers:
-        freq[n] = freq.get(n, 0) + 1
-    return freq
-
-def main():
-    try:
+    # Counter tallies the whole list in one C-level loop instead of a
+    # Python-level get-and-store per element
+    return dict(Counter(numbers))
+''' + _main_scaffold('''\
         numbers = list(map(int, input("Enter numbers (space-separated): ").split()))
         result = element_frequency(numbers)
         print("Element frequencies:")
         for k, v in result.items():
-            print(f"{k}: {v}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+            print(f"{k}: {v}")''')
                 },
                 'keywords': ['frequency of each element', 'element frequency', 'count frequency in list']
             },
@@ -803,26 +776,23 @@ if __name__ == "__main__":
                 'implementation': {
                     'algorithm': 'common_unique_elements',
                     'complexity': 'O(n+m)',
-                    'template': '''from typing import List
+                    'template': '''import numpy as np
+from typing import List
 
 def common_unique_elements(list1: List[int], list2: List[int]) -> List[int]:
     """
     Find all unique elements common to two lists.
     """
-    return list(set(list1) & set(list2))
-
-def main():
-    try:
+    # intersect1d deduplicates and intersects via sorted merges in C;
+    # the result comes back sorted rather than in set order
+    common = np.intersect1d(np.asarray(list1, dtype=np.int64),
+                            np.asarray(list2, dtype=np.int64))
+    return common.tolist()
+''' + _main_scaffold('''\
         list1 = list(map(int, input("Enter first list (space-separated): ").split()))
         list2 = list(map(int, input("Enter second list (space-separated): ").split()))
         result = common_unique_elements(list1, list2)
-        print(f"Common unique elements: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Common unique elements: {result}")''')
                 },
                 'keywords': ['unique elements common', 'common elements', 'intersection of lists']
             },
@@ -841,21 +811,13 @@ def shuffle_list(numbers: List[int]) -> List[int]:
     """
     Shuffle the elements of a list randomly.
     """
-    shuffled = numbers[:]
-    random.shuffle(shuffled)
-    return shuffled
-
-def main():
-    try:
+    # sample with k == len builds the shuffled copy in one pass,
+    # skipping the explicit copy that random.shuffle would need
+    return random.sample(numbers, len(numbers))
+''' + _main_scaffold('''\
         numbers = list(map(int, input("Enter numbers (space-separated): ").split()))
         result = shuffle_list(numbers)
-        print(f"Shuffled list: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Shuffled list: {result}")''')
                 },
                 'keywords': ['shuffle list', 'randomly shuffle', 'random order']
             },
@@ -887,19 +849,11 @@ def lcm(a: int, b: int) -> int:
     if a == 0 or b == 0:
         return 0
     return abs(a * b) // gcd(a, b)
-
-def main():
-    try:
+''' + _main_scaffold('''\
         a = int(input("Enter first number: "))
         b = int(input("Enter second number: "))
         result = lcm(a, b)
-        print(f"LCM of {a} and {b} is: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"LCM of {a} and {b} is: {result}")''')
                 },
                 'keywords': ['lcm', 'least common multiple', 'find lcm']
             },
@@ -915,25 +869,15 @@ if __name__ == "__main__":
     """
     Convert a decimal number to binary.
     """
+    # bin() converts in C in linear time; prepending digits to a str
+    # copies the accumulated prefix on every iteration
     if n == 0:
         return "0"
-    binary = ""
-    while n > 0:
-        binary = str(n % 2) + binary
-        n //= 2
-    return binary
-
-def main():
-    try:
+    return bin(n)[2:] if n > 0 else "-" + bin(-n)[2:]
+''' + _main_scaffold('''\
         n = int(input("Enter a decimal number: "))
         result = decimal_to_binary(n)
-        print(f"Binary representation: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Binary representation: {result}")''')
                 },
                 'keywords': ['decimal to binary', 'convert decimal', 'binary conversion']
             },
@@ -949,19 +893,18 @@ if __name__ == "__main__":
     """
     Find the sum of digits of a number.
     """
-    return sum(int(digit) for digit in str(abs(n)))
-
-def main():
-    try:
+    # divmod peels digits arithmetically - no str allocation and no
+    # per-digit int() parse
+    m = abs(n)
+    s = 0
+    while m:
+        m, d = divmod(m, 10)
+        s += d
+    return s
+''' + _main_scaffold('''\
         n = int(input("Enter a number: "))
         result = sum_of_digits(n)
-        print(f"Sum of digits: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Sum of digits: {result}")''')
                 },
                 'keywords': ['sum of digits', 'digit sum', 'sum digits']
             },
@@ -973,31 +916,29 @@ if __name__ == "__main__":
                 'implementation': {
                     'algorithm': 'find_factors',
                     'complexity': 'O(sqrt(n))',
-                    'template': '''from typing import List
+                    'template': '''import math
+from typing import List
 
 def find_factors(n: int) -> List[int]:
     """
     Find all factors of a given number.
     """
-    factors = []
-    for i in range(1, int(n ** 0.5) + 1):
+    # Small divisors arrive in ascending order and their complements in
+    # descending order, so collecting them separately and reversing the
+    # second list replaces the final sort
+    lo, hi = [], []
+    for i in range(1, math.isqrt(n) + 1):
         if n % i == 0:
-            factors.append(i)
-            if i != n // i:
-                factors.append(n // i)
-    return sorted(factors)
-
-def main():
-    try:
+            lo.append(i)
+            q = n // i
+            if q != i:
+                hi.append(q)
+    hi.reverse()
+    return lo + hi
+''' + _main_scaffold('''\
         n = int(input("Enter a number: "))
         result = find_factors(n)
-        print(f"Factors: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Factors: {result}")''')
                 },
                 'keywords': ['factors', 'find factors', 'all factors']
             },
@@ -1009,32 +950,24 @@ if __name__ == "__main__":
                 'implementation': {
                     'algorithm': 'strong_number',
                     'complexity': 'O(log n)',
-                    'template': '''def factorial(n: int) -> int:
-    """
-    Calculate the factorial of a number.
-    """
-    if n == 0:
-        return 1
-    return n * factorial(n - 1)
+                    'template': '''
+# Digit factorials 0!..9!, folded to a literal so the emitted program
+# does no factorial arithmetic at all
+_DIGIT_FACTORIALS = (1, 1, 2, 6, 24, 120, 720, 5040, 40320, 362880)
 
 def is_strong_number(n: int) -> bool:
     """
     Check if a number is a strong number.
     A strong number is a number whose sum of the factorial of digits is equal to the number itself.
     """
-    return n == sum(factorial(int(digit)) for digit in str(n))
-
-def main():
-    try:
+    # ord(c) - 48 maps a digit character straight to its table index,
+    # skipping the per-digit int() parse. Negatives are ruled out up
+    # front: no negative is strong, and the '-' would alias an index
+    return n >= 0 and n == sum(_DIGIT_FACTORIALS[ord(c) - 48] for c in str(n))
+''' + _main_scaffold('''\
         n = int(input("Enter a number: "))
         result = is_strong_number(n)
-        print(f"Is strong number: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Is strong number: {result}")''')
                 },
                 'keywords': ['strong number', 'check strong number', 'is strong number']
             },
@@ -1050,19 +983,17 @@ if __name__ == "__main__":
     """
     Reverse the digits of a number.
     """
-    return int(str(abs(n))[::-1]) * (1 if n >= 0 else -1)
-
-def main():
-    try:
+    # Pure integer arithmetic: no str round trip, no re-parse
+    m = abs(n)
+    r = 0
+    while m:
+        r = r * 10 + m % 10
+        m //= 10
+    return r if n >= 0 else -r
+''' + _main_scaffold('''\
         n = int(input("Enter a number: "))
         result = reverse_digits(n)
-        print(f"Reversed number: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"Reversed number: {result}")''')
                 },
                 'keywords': ['reverse digits', 'reverse number', 'reverse a number']
             },
@@ -1076,40 +1007,45 @@ if __name__ == "__main__":
                     'complexity': 'O(n * sqrt(n))',
                     'template': '''from typing import List
 
-def is_prime(num: int) -> bool:
+import math
+
+def _sieve_odds(limit: int) -> List[int]:
     """
-    Check if a number is prime.
+    Sieve of Eratosthenes over odd numbers up to limit.
     """
-    if num < 2:
-        return False
-    for i in range(2, int(num ** 0.5) + 1):
-        if num % i == 0:
-            return False
-    return True
+    # Index i stands for 2*i + 1, halving the table; striding
+    # composites out with slice assignment runs the inner loop in C
+    half = (limit >> 1) + 1
+    sieve = bytearray([1]) * half
+    sieve[0] = 0  # 1 is not prime
+    for i in range(1, (math.isqrt(limit) >> 1) + 1):
+        if sieve[i]:
+            p = 2 * i + 1
+            start = (p * p) >> 1
+            sieve[start::p] = bytes(len(range(start, half, p)))
+    return [2] + [2 * i + 1 for i in range(1, half) if sieve[i]]
 
 def first_n_primes(n: int) -> List[int]:
     """
     Print the first n prime numbers.
     """
-    primes = []
-    num = 2
+    if n < 1:
+        return []
+    # Prime-number-theorem bound on the nth prime; on the rare
+    # shortfall the limit doubles and the sieve reruns
+    if n < 6:
+        limit = 15
+    else:
+        limit = int(n * (math.log(n) + math.log(math.log(n)))) + 10
+    primes = _sieve_odds(limit)
     while len(primes) < n:
-        if is_prime(num):
-            primes.append(num)
-        num += 1
-    return primes
-
-def main():
-    try:
+        limit *= 2
+        primes = _sieve_odds(limit)
+    return primes[:n]
+''' + _main_scaffold('''\
         n = int(input("Enter the number of primes to generate: "))
         result = first_n_primes(n)
-        print(f"First {n} prime numbers: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"First {n} prime numbers: {result}")''')
                 },
                 'keywords': ['first n prime numbers', 'generate primes', 'print primes']
             },
@@ -1129,24 +1065,33 @@ def first_n_fibonacci(n: int) -> List[int]:
     """
     if n <= 0:
         return []
-    if n == 1:
-        return [0]
-    fib = [0, 1]
-    for i in range(2, n):
-        fib.append(fib[i-1] + fib[i-2])
-    return fib
-
-def main():
-    try:
+    # Preallocate and fill: no append reallocations, and the a, b
+    # rotation avoids indexing back into the list each step
+    out = [0] * n
+    a, b = 0, 1
+    for i in range(n):
+        out[i] = a
+        a, b = b, a + b
+    return out
+
+def nth_fibonacci(k: int) -> int:
+    """
+    Return F(k) alone in O(log k) big-integer multiplications.
+    """
+    # Fast doubling: F(2m) = F(m) * (2*F(m+1) - F(m)) and
+    # F(2m+1) = F(m)**2 + F(m+1)**2, halving k per step
+    def pair(m: int):
+        if m == 0:
+            return (0, 1)
+        f, g = pair(m >> 1)
+        c = f * (2 * g - f)
+        d = f * f + g * g
+        return (d, c + d) if m & 1 else (c, d)
+    return pair(k)[0]
+''' + _main_scaffold('''\
         n = int(input("Enter the number of Fibonacci numbers to generate: "))
         result = first_n_fibonacci(n)
-        print(f"First {n} Fibonacci numbers: {result}")
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        print(f"First {n} Fibonacci numbers: {result}")''')
                 },
                 'keywords': ['first n fibonacci numbers', 'generate fibonacci', 'print fibonacci']
             },
@@ -1164,22 +1109,180 @@ if __name__ == "__main__":
     """
     for i in range(1, 11):
         print(f"{n} x {i} = {n * i}")
-
-def main():
-    try:
+''' + _main_scaffold('''\
         n = int(input("Enter a number: "))
-        multiplication_table(n)
-    except Exception as e:
-        print(f"Error: {str(e)}")
-
-if __name__ == "__main__":
-    main()
-'''
+        multiplication_table(n)''')
                 },
                 'keywords': ['multiplication table', 'generate table', 'print table']
             }
         }
-    
+    frozen = {}
+    for key, pattern in patterns.items():
+        pattern['keywords'] = tuple(sys.intern(k) for k in pattern['keywords'])
+        # Hash-based companion for exact keyword membership tests, so
+        # callers never have to walk the tuple
+        pattern['keywords_set'] = frozenset(pattern['keywords'])
+        pattern['implementation'] = MappingProxyType(pattern['implementation'])
+        frozen[key] = MappingProxyType(pattern)
+    return MappingProxyType(frozen)
+
+@lru_cache(maxsize=1)
+def _any_keyword_re():
+    """
+    Every keyword of every pattern folded into one alternation. The
+    keyword lists share heavy prefixes ("find max"/"find maximum",
+    "count even"/"count odd"), and re's compiler collapses those into
+    a single first-character dispatch, so one search answers "could
+    any pattern match at all?". Purposes that hit no keyword (the
+    generic-function fallback) then skip the per-pattern scan
+    entirely. Sorted longest-first so the combined regex prefers the
+    most specific keyword at each position.
+    """
+    keywords = {keyword
+                for pattern in _load_patterns().values()
+                for keyword in pattern['keywords']}
+    return re.compile('|'.join(re.escape(k)
+                               for k in sorted(keywords, key=len, reverse=True)))
+
+@lru_cache(maxsize=1)
+def _keyword_regexes() -> List[tuple]:
+    """
+    One compiled alternation per pattern: the fallback keyword scan in
+    _match_implementation_pattern then needs a single C-level regex
+    search per pattern instead of one Python substring scan per
+    keyword. Pattern order is preserved — it decides which pattern
+    wins when several match.
+    """
+    return [
+        (pattern,
+         re.compile('|'.join(re.escape(k)
+                             for k in sorted(pattern['keywords'],
+                                             key=len, reverse=True))))
+        for pattern in _load_patterns().values()
+    ]
+
+@lru_cache(maxsize=1024)
+def _match_purpose(purpose: str) -> Optional[Mapping[str, Any]]:
+    """
+    Match a lowercased purpose string against the pattern table.
+
+    Module-level and memoized: the probe chain reads only the shared
+    pattern table and compiled keyword regexes, so a repeat purpose
+    (from any analyzer instance) resolves in one dict lookup instead
+    of re-running every probe.
+    """
+    patterns = _load_patterns()
+    # String manipulation patterns
+    if any(keyword in purpose for keyword in ['vowel', 'consonant']) and 'count' in purpose:
+        return patterns['count_vowels_consonants']
+    if 'anagram' in purpose:
+        return patterns['check_anagrams']
+    if ('non' in purpose and 'alphabet' in purpose) or ('non' in purpose and 'alpha' in purpose):
+        return patterns['remove_non_alpha']
+    if 'longest word' in purpose:
+        return patterns['find_longest_word']
+    if 'replace' in purpose and 'space' in purpose:
+        return patterns['replace_spaces']
+    if 'frequency' in purpose and 'character' in purpose:
+        return patterns['count_char_frequency']
+    if 'toggle' in purpose and 'case' in purpose:
+        return patterns['toggle_case']
+    # List manipulation patterns
+    if ('even' in purpose and 'odd' in purpose and 'count' in purpose) or ('count' in purpose and 'even' in purpose) or ('count' in purpose and 'odd' in purpose):
+        return patterns['count_even_odd']
+    if 'merge' in purpose and 'sorted' in purpose and 'list' in purpose:
+        return patterns['merge_sorted_lists']
+    if ('remove' in purpose and 'element' in purpose) or ('remove' in purpose and 'occurrences' in purpose):
+        return patterns['remove_element']
+    if ('split' in purpose and 'list' in purpose and 'half' in purpose) or ('divide' in purpose and 'list' in purpose):
+        return patterns['split_list_halves']
+    if ('difference' in purpose and 'maximum' in purpose and 'minimum' in purpose) or ('max' in purpose and 'min' in purpose and 'difference' in purpose):
+        return patterns['max_min_difference']
+    if ('frequency' in purpose and 'element' in purpose) or ('count' in purpose and 'frequency' in purpose and 'list' in purpose):
+        return patterns['element_frequency']
+    if ('unique' in purpose and 'common' in purpose and 'list' in purpose) or ('common' in purpose and 'elements' in purpose and 'list' in purpose):
+        return patterns['common_unique_elements']
+    if ('shuffle' in purpose and 'list' in purpose) or ('random' in purpose and 'order' in purpose):
+        return patterns['shuffle_list']
+    # Number-based patterns
+    if 'lcm' in purpose or 'least common multiple' in purpose:
+        return patterns['lcm']
+    if 'decimal to binary' in purpose or 'convert decimal' in purpose:
+        return patterns['decimal_to_binary']
+    if 'sum of digits' in purpose or 'digit sum' in purpose:
+        return patterns['sum_of_digits']
+    if 'factors' in purpose or 'find factors' in purpose:
+        return patterns['find_factors']
+    if 'strong number' in purpose or 'check strong number' in purpose:
+        return patterns['strong_number']
+    if 'reverse digits' in purpose or 'reverse number' in purpose:
+        return patterns['reverse_digits']
+    if 'first n prime numbers' in purpose or 'generate primes' in purpose:
+        return patterns['first_n_primes']
+    if 'first n fibonacci numbers' in purpose or 'generate fibonacci' in purpose:
+        return patterns['first_n_fibonacci']
+    if 'multiplication table' in purpose or 'generate table' in purpose:
+        return patterns['multiplication_table']
+    # Existing checks for other patterns
+    operations = {'add', 'subtract', 'multiply', 'divide'}
+    for op in operations:
+        if op in purpose:
+            # Cached and therefore shared, so frozen like the
+            # table-backed patterns
+            return MappingProxyType({
+                'type': 'function',
+                'name': f"{op}_numbers",
+                'parameters': [
+                    {'name': 'a', 'type': 'int'},
+                    {'name': 'b', 'type': 'int'}
+                ],
+                'return_type': 'int',
+                'implementation': MappingProxyType({
+                    'algorithm': 'arithmetic',
+                    'operation': op
+                })
+            })
+    if 'binary search' in purpose:
+        return patterns['binary_search']
+    elif 'bubble sort' in purpose:
+        return patterns['bubble_sort']
+    elif 'linked list' in purpose:
+        return patterns['linked_list']
+    elif 'binary tree' in purpose:
+        return patterns['binary_tree']
+    elif 'graph' in purpose:
+        return patterns['graph']
+    elif 'dijkstra' in purpose:
+        return patterns['dijkstra']
+    # Cheap pre-filter: if no keyword of any pattern occurs in the
+    # purpose, skip the ordered per-pattern scan. When the filter
+    # hits, the scan below still decides the winner — pattern
+    # order, not keyword length, carries the priority.
+    if _any_keyword_re().search(purpose):
+        for pattern, keyword_re in _keyword_regexes():
+            if keyword_re.search(purpose):
+                return pattern
+    return None
+
+class SemanticAnalyzer:
+    """Analyzes semantic meaning of parsed instructions."""
+
+    # Upper bound on cached analysis results; old entries are evicted LRU
+    _CACHE_SIZE = 4096
+
+    def __init__(self):
+        """Initialize the semantic analyzer with common patterns."""
+        self.context = {}  # Additional context for analysis
+        self.implementation_patterns = _load_patterns()
+        self._keyword_patterns = _keyword_regexes()
+        self._any_keyword_re = _any_keyword_re()
+
+        # LRU cache of SemanticInfo keyed on the extracted purpose
+        # string. The purpose is already a normalized single-space
+        # token join, and it is the only input analyze() depends on,
+        # so a repeat instruction skips the whole pattern scan.
+        self._analyze_cache: "OrderedDict[str, SemanticInfo]" = OrderedDict()
+
     def set_context(self, context: Dict[str, Any]):
         """
         Set additional context for semantic analysis.
@@ -1201,14 +1304,20 @@ if __name__ == "__main__":
         """
         # Extract purpose from parse tree
         purpose = self._extract_purpose(parse_tree)
-        
-        # DEBUG: Log the purpose string
-        print(f"[DEBUG] Purpose for semantic analysis: '{purpose}'")
-        
+
+        # Formatting is deferred to the logging framework, so the call
+        # is a no-op unless DEBUG logging is enabled
+        logger.debug("Purpose for semantic analysis: %r", purpose)
+
+        cached = self._analyze_cache.get(purpose)
+        if cached is not None:
+            self._analyze_cache.move_to_end(purpose)
+            return cached
+
         # Match purpose against known patterns
         implementation = self._match_implementation_pattern(purpose)
         if implementation:
-            return SemanticInfo(
+            info = SemanticInfo(
                 type=implementation['type'],
                 name=implementation['name'],
                 parameters=implementation['parameters'],
@@ -1216,115 +1325,54 @@ if __name__ == "__main__":
                 implementation=implementation['implementation'],
                 docstring=self._generate_docstring(purpose)
             )
-        
-        # If no pattern matches, use generic function template
-        return SemanticInfo(
-            type='function',
-            name='generated_function',
-            parameters=[{'name': 'n', 'type': 'int'}],
-            return_type='bool',
-            implementation={'algorithm': 'generic'},
-            docstring=self._generate_docstring(purpose)
-        )
+        else:
+            # If no pattern matches, use generic function template
+            info = SemanticInfo(
+                type='function',
+                name='generated_function',
+                parameters=_GENERIC_PARAMETERS,
+                return_type='bool',
+                implementation=_GENERIC_IMPLEMENTATION,
+                docstring=self._generate_docstring(purpose)
+            )
+
+        self._analyze_cache[purpose] = info
+        if len(self._analyze_cache) > self._CACHE_SIZE:
+            self._analyze_cache.popitem(last=False)
+        return info
     
     def _extract_purpose(self, node: ParseNode) -> str:
         """Extract purpose from parse tree node."""
         if node.type == NodeType.FUNCTION:
+            # The parser already joined the token text once at parse
+            # time; rejoin only for nodes built by hand without it
+            purpose = node.metadata.get('purpose')
+            if purpose is not None:
+                return purpose
             return ' '.join(token.text for token in node.tokens)
         return ''
     
-    def _match_implementation_pattern(self, purpose: str) -> Optional[Dict[str, Any]]:
+    def _match_implementation_pattern(self, purpose: str) -> Optional[Mapping[str, Any]]:
         """Match purpose against known implementation patterns."""
-        purpose = purpose.lower()
-        # String manipulation patterns
-        if any(keyword in purpose for keyword in ['vowel', 'consonant']) and 'count' in purpose:
-            return self.implementation_patterns['count_vowels_consonants']
-        if 'anagram' in purpose:
-            return self.implementation_patterns['check_anagrams']
-        if ('non' in purpose and 'alphabet' in purpose) or ('non' in purpose and 'alpha' in purpose):
-            return self.implementation_patterns['remove_non_alpha']
-        if 'longest word' in purpose:
-            return self.implementation_patterns['find_longest_word']
-        if 'replace' in purpose and 'space' in purpose:
-            return self.implementation_patterns['replace_spaces']
-        if 'frequency' in purpose and 'character' in purpose:
-            return self.implementation_patterns['count_char_frequency']
-        if 'toggle' in purpose and 'case' in purpose:
-            return self.implementation_patterns['toggle_case']
-        # List manipulation patterns
-        if ('even' in purpose and 'odd' in purpose and 'count' in purpose) or ('count' in purpose and 'even' in purpose) or ('count' in purpose and 'odd' in purpose):
-            return self.implementation_patterns['count_even_odd']
-        if 'merge' in purpose and 'sorted' in purpose and 'list' in purpose:
-            return self.implementation_patterns['merge_sorted_lists']
-        if ('remove' in purpose and 'element' in purpose) or ('remove' in purpose and 'occurrences' in purpose):
-            return self.implementation_patterns['remove_element']
-        if ('split' in purpose and 'list' in purpose and 'half' in purpose) or ('divide' in purpose and 'list' in purpose):
-            return self.implementation_patterns['split_list_halves']
-        if ('difference' in purpose and 'maximum' in purpose and 'minimum' in purpose) or ('max' in purpose and 'min' in purpose and 'difference' in purpose):
-            return self.implementation_patterns['max_min_difference']
-        if ('frequency' in purpose and 'element' in purpose) or ('count' in purpose and 'frequency' in purpose and 'list' in purpose):
-            return self.implementation_patterns['element_frequency']
-        if ('unique' in purpose and 'common' in purpose and 'list' in purpose) or ('common' in purpose and 'elements' in purpose and 'list' in purpose):
-            return self.implementation_patterns['common_unique_elements']
-        if ('shuffle' in purpose and 'list' in purpose) or ('random' in purpose and 'order' in purpose):
-            return self.implementation_patterns['shuffle_list']
-        # Number-based patterns
-        if 'lcm' in purpose or 'least common multiple' in purpose:
-            return self.implementation_patterns['lcm']
-        if 'decimal to binary' in purpose or 'convert decimal' in purpose:
-            return self.implementation_patterns['decimal_to_binary']
-        if 'sum of digits' in purpose or 'digit sum' in purpose:
-            return self.implementation_patterns['sum_of_digits']
-        if 'factors' in purpose or 'find factors' in purpose:
-            return self.implementation_patterns['find_factors']
-        if 'strong number' in purpose or 'check strong number' in purpose:
-            return self.implementation_patterns['strong_number']
-        if 'reverse digits' in purpose or 'reverse number' in purpose:
-            return self.implementation_patterns['reverse_digits']
-        if 'first n prime numbers' in purpose or 'generate primes' in purpose:
-            return self.implementation_patterns['first_n_primes']
-        if 'first n fibonacci numbers' in purpose or 'generate fibonacci' in purpose:
-            return self.implementation_patterns['first_n_fibonacci']
-        if 'multiplication table' in purpose or 'generate table' in purpose:
-            return self.implementation_patterns['multiplication_table']
-        # Existing checks for other patterns
-        operations = {'add', 'subtract', 'multiply', 'divide'}
-        for op in operations:
-            if op in purpose:
-                return {
-                    'type': 'function',
-                    'name': f"{op}_numbers",
-                    'parameters': [
-                        {'name': 'a', 'type': 'int'},
-                        {'name': 'b', 'type': 'int'}
-                    ],
-                    'return_type': 'int',
-                    'implementation': {
-                        'algorithm': 'arithmetic',
-                        'operation': op
-                    }
-                }
-        if 'binary search' in purpose:
-            return self.implementation_patterns['binary_search']
-        elif 'bubble sort' in purpose:
-            return self.implementation_patterns['bubble_sort']
-        elif 'linked list' in purpose:
-            return self.implementation_patterns['linked_list']
-        elif 'binary tree' in purpose:
-            return self.implementation_patterns['binary_tree']
-        elif 'graph' in purpose:
-            return self.implementation_patterns['graph']
-        elif 'dijkstra' in purpose:
-            return self.implementation_patterns['dijkstra']
-        for pattern in self.implementation_patterns.values():
-            if any(keyword in purpose for keyword in pattern['keywords']):
-                return pattern
-        return None
-    
+        return _match_purpose(purpose.lower())
+
     def _generate_docstring(self, purpose: str) -> str:
         """Generate docstring from purpose."""
         return f"Generated from instruction: {purpose}"
 
+@lru_cache(maxsize=1)
+def get_default_analyzer() -> SemanticAnalyzer:
+    """
+    Shared analyzer for callers that don't need isolated context.
+
+    Construction is cheap now that the pattern table is shared, but
+    reusing one instance also shares the analysis result cache across
+    call sites. Callers that set_context() should keep building their
+    own instances — context on the shared one would leak between
+    users.
+    """
+    return SemanticAnalyzer()
+
 class SemanticError(Exception):
     """Exception raised when semantic analysis fails."""
     pass 
\ No newline at end of file
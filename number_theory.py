@@ -18,11 +18,22 @@ def is_fibonacci(n: int) -> bool:
         False
     """
     # A number is Fibonacci if and only if one or both of (5*n^2 + 4) or (5*n^2 - 4) is a perfect square
-    return is_perfect_square(5 * n * n + 4) or is_perfect_square(5 * n * n - 4)
+    t = 5 * n * n
+    # Checks inlined with isqrt: t is computed once, and the t - 4
+    # candidate is never reached when n == 0 (t + 4 == 4 matches first),
+    # so isqrt never sees a negative argument
+    for k in (t + 4, t - 4):
+        s = math.isqrt(k)
+        if s * s == k:
+            return True
+    return False
 
 def is_perfect_square(n: int) -> bool:
     """Check if a number is a perfect square."""
-    s = int(math.sqrt(n))
+    if n < 0:
+        return False
+    # isqrt is exact for any int; float sqrt rounds wrong near 2**53
+    s = math.isqrt(n)
     return s * s == n
 
 def is_prime(n: int) -> bool:
@@ -37,8 +48,41 @@ def is_prime(n: int) -> bool:
     """
     if n < 2:
         return False
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
+    if n < 4:
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    if n > 1_000_000:
+        return _miller_rabin(n)
+    # 6k+-1 wheel: once 2 and 3 are ruled out, every prime factor is
+    # of the form 6k+-1, skipping two thirds of the trial divisors
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+        i += 6
+    return True
+
+# Witnesses that make Miller-Rabin deterministic for n < 3.3e24
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def _miller_rabin(n: int) -> bool:
+    """Deterministic Miller-Rabin primality test for odd n > 3."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _WITNESSES:
+        # pow(a, d, n) runs modular exponentiation in C, so each
+        # witness costs O(log n) multiplies instead of sqrt(n) divisions
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
     return True
 
@@ -87,14 +131,39 @@ def is_perfect_number(n: int) -> bool:
     """
     if n <= 0:
         return False
+    if n % 2 == 0 and n > 2:
+        return _is_mersenne_perfect(n)
+    # No odd perfect number is known; sum divisors the slow way, but
+    # only odd candidates can divide an odd n, and overshooting the
+    # target ends the scan early
     divisors_sum = 1  # 1 is always a divisor
-    for i in range(2, int(math.sqrt(n)) + 1):
+    for i in range(3, math.isqrt(n) + 1, 2):
         if n % i == 0:
             divisors_sum += i
             if i != n // i:  # Add the other divisor if it's different
                 divisors_sum += n // i
+            if divisors_sum > n:
+                return False
     return divisors_sum == n
 
+# Exponents of known Mersenne primes; the largest entry puts every
+# even perfect number below 2**2557 in reach of the table
+_MERSENNE_EXPONENTS = (2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 107, 127,
+                       521, 607, 1279)
+
+def _is_mersenne_perfect(n: int) -> bool:
+    """Test n against the Euclid-Euler form of even perfect numbers."""
+    # Every even perfect number is 2**(p-1) * (2**p - 1) with
+    # 2**p - 1 a Mersenne prime, so the check is a table walk
+    # instead of an O(sqrt(n)) divisor scan
+    for p in _MERSENNE_EXPONENTS:
+        candidate = (1 << (p - 1)) * ((1 << p) - 1)
+        if candidate == n:
+            return True
+        if candidate > n:
+            return False
+    return False
+
 def get_user_input(prompt: str) -> int:
     """
     Get a valid integer from user input.
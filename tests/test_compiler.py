@@ -7,9 +7,15 @@ from nlp_compiler import NLCompiler
 from nlp_compiler.lexer.tokenizer import Tokenizer
 from nlp_compiler.parser.parser import Parser, ParseError
 from nlp_compiler.semantic.analyzer import SemanticAnalyzer, SemanticError
-from nlp_compiler.codegen.generator import CodeGenerator, CodeGenerationError
+from nlp_compiler.codegen.generator import CodeGenerator, CodeGenError
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def nlp():
+    """Load the spaCy model once for the whole test run."""
+    import spacy
+    return spacy.load("en_core_web_sm")
+
+@pytest.fixture(scope="session")
 def compiler():
     """Create a compiler instance for testing."""
     return NLCompiler()
@@ -64,10 +70,8 @@ def test_invalid_instruction(compiler):
     with pytest.raises(ParseError):
         compiler.compile("This is not a valid instruction")
 
-def test_tokenizer():
+def test_tokenizer(nlp):
     """Test the tokenizer component."""
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
     tokenizer = Tokenizer(nlp)
     tokens = tokenizer.tokenize("Write a function to check if a number is prime")
     
@@ -77,11 +81,9 @@ def test_tokenizer():
     assert any(t.pos == "VERB" for t in tokens)  # Should have some verbs
     assert any(t.pos == "NOUN" for t in tokens)  # Should have some nouns
 
-def test_parser():
+def test_parser(nlp):
     """Test the parser component."""
     from nlp_compiler.parser.parser import NodeType
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
     parser = Parser()
     tokenizer = Tokenizer(nlp)
     
@@ -92,10 +94,8 @@ def test_parser():
     assert len(parse_tree.children) == 1
     assert parse_tree.children[0].type == NodeType.FUNCTION
 
-def test_semantic_analyzer():
+def test_semantic_analyzer(nlp):
     """Test the semantic analyzer component."""
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
     analyzer = SemanticAnalyzer()
     parser = Parser()
     tokenizer = Tokenizer(nlp)
@@ -110,10 +110,8 @@ def test_semantic_analyzer():
     assert len(semantic_info.parameters) == 1
     assert semantic_info.return_type == "bool"
 
-def test_code_generator():
+def test_code_generator(nlp):
     """Test the code generator component."""
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
     generator = CodeGenerator()
     analyzer = SemanticAnalyzer()
     parser = Parser()